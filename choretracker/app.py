@@ -1,13 +1,15 @@
 from datetime import datetime, timedelta, date
 from pathlib import Path
+import asyncio
 import json
 import os
 import subprocess
 from urllib.parse import urlparse
 from heapq import heappush, heappop
 from typing import Iterator
-from itertools import count
-from collections import Counter
+from itertools import count, zip_longest
+from operator import itemgetter
+from collections import Counter, defaultdict
 import secrets
 import logging
 
@@ -34,7 +36,7 @@ from markupsafe import Markup
 import bleach
 import base64
 import posixpath
-from jinja2 import pass_context
+from jinja2 import Environment, FileSystemLoader, pass_context
 
 from .time_utils import get_now, parse_datetime, ensure_tz, end_of_day
 from .users import (
@@ -64,6 +66,7 @@ from .calendar import (
     find_instance_duration,
     find_instance_start,
     find_instance_note,
+    get_recurrence,
     responsible_for,
 )
 from .settings import SettingsStore
@@ -102,6 +105,11 @@ ALL_PERMISSIONS = [
     "iam",
 ]
 
+ALL_PERMISSIONS_SET = frozenset(ALL_PERMISSIONS)
+
+# Upper bound for a single multipart part (e.g. a profile picture upload).
+MAX_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
 READ_PERMS = {
     CalendarEntryType.Event: "events.read",
     CalendarEntryType.Reminder: "reminders.read",
@@ -119,7 +127,14 @@ app = FastAPI()
 logger = logging.getLogger(__name__)
 
 BASE_PATH = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_PATH / "templates"))
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(str(BASE_PATH / "templates")),
+        autoescape=True,
+        # Templates only change on deploy; skip the per-render mtime stat.
+        auto_reload=os.getenv("CHORETRACKER_TEMPLATE_AUTO_RELOAD") == "1",
+    )
+)
 templates.env.globals["all_users"] = lambda: sorted(
     user_store.list_users(include_viewer=True),
     key=lambda u: (u.username == "Viewer", u.username),
@@ -150,6 +165,27 @@ def relative_url_for(request: Request, name: str, /, **path_params: str) -> str:
     return _make_relative(request.url.path, target)
 
 
+def redirect_to_instance(
+    request: Request, entry_id: int, rid: int, iindex: int
+) -> RedirectResponse:
+    """Redirect back to the referring page, defaulting to the instance view.
+
+    The fallback URL is only constructed when no referer header is present.
+    """
+    referer = request.headers.get("referer")
+    if referer is None:
+        referer = str(
+            relative_url_for(
+                request,
+                "view_time_period",
+                entry_id=entry_id,
+                recurrence_id=rid,
+                iindex=iindex,
+            )
+        )
+    return RedirectResponse(url=referer, status_code=303)
+
+
 @pass_context
 def _jinja_url_for(context, name: str, /, **path_params: str) -> str:  # type: ignore[override]
     request: Request = context["request"]
@@ -329,7 +365,27 @@ def recurrence_summary(rec: Recurrence) -> str:
 
 templates.env.globals["time_range_summary"] = time_range_summary
 templates.env.globals["recurrence_summary"] = recurrence_summary
-app.mount("/static", StaticFiles(directory=str(BASE_PATH / "static")), name="static")
+
+
+# Compile every template once at import so no request pays the parse cost.
+for _name in templates.env.list_templates():
+    templates.env.get_template(_name)
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets for a day.
+
+    The assets aren't content-hashed, so a bounded max-age is used instead
+    of an immutable far-future policy; conditional requests still revalidate
+    via the ETag/Last-Modified headers StaticFiles already emits.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=86400"
+        return response
+
+
+app.mount("/static", CachedStaticFiles(directory=str(BASE_PATH / "static")), name="static")
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -338,7 +394,28 @@ async def favicon() -> Response:
     return Response(data, media_type="image/x-icon")
 
 
+# entry_time_bounds results keyed by entry id, valid while the entry's
+# updated_at stamp is unchanged. Bounded so a long-lived process cannot
+# grow it without limit.
+_BOUNDS_CACHE: dict[int, tuple[datetime, tuple[datetime, datetime | None]]] = {}
+_BOUNDS_CACHE_MAX = 4096
+
+
 def entry_time_bounds(entry: CalendarEntry) -> tuple[datetime, datetime | None]:
+    version = entry.updated_at
+    if entry.id is not None and version is not None:
+        cached = _BOUNDS_CACHE.get(entry.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    bounds = _entry_time_bounds(entry)
+    if entry.id is not None and version is not None:
+        if len(_BOUNDS_CACHE) >= _BOUNDS_CACHE_MAX:
+            _BOUNDS_CACHE.clear()
+        _BOUNDS_CACHE[entry.id] = (version, bounds)
+    return bounds
+
+
+def _entry_time_bounds(entry: CalendarEntry) -> tuple[datetime, datetime | None]:
     periods = enumerate_time_periods(entry)
     first = next(periods, None)
     if not first:
@@ -357,9 +434,25 @@ def entry_time_bounds(entry: CalendarEntry) -> tuple[datetime, datetime | None]:
     return (start, end)
 
 
+def _sort_by_start(
+    entries: list[CalendarEntry], start_map: dict[int, datetime]
+) -> list[CalendarEntry]:
+    """Sort entries newest-first by their start time in ``start_map``.
+
+    Decorate-sort-undecorate with a C-implemented key avoids a Python lambda
+    call per comparison; the sort is stable, so ties keep their order.
+    """
+    decorated = [(start_map[e.id], e) for e in entries]
+    decorated.sort(key=itemgetter(0), reverse=True)
+    return [e for _, e in decorated]
+
+
 def has_finished_instances(entry: CalendarEntry, now: datetime | None = None) -> bool:
     if now is None:
         now = get_now()
+    # until=now would clamp on the NOMINAL instance start, but an instance
+    # started early via a start override can be finished while its nominal
+    # start is still in the future — it must still be generated here.
     for period in enumerate_time_periods(entry, include_skipped=True):
         end = ensure_tz(period.end)
         start = ensure_tz(period.start)
@@ -379,14 +472,37 @@ def has_unfinished_instances(entry: CalendarEntry, now: datetime | None = None)
     return False
 
 
+class Principal:
+    """The session user and their permissions, resolved once per request."""
+
+    def __init__(self, username: str | None, perms: frozenset[str]):
+        self.username = username
+        self.perms = perms
+
+    def has(self, permission: str) -> bool:
+        return "admin" in self.perms or permission in self.perms
+
+
+def get_principal(request: Request) -> Principal:
+    """Return the request's :class:`Principal`, caching it on ``request.state``."""
+    principal = getattr(request.state, "principal", None)
+    if principal is None:
+        username = request.session.get("user")
+        user = user_store.get(username) if username else None
+        perms = frozenset(user.permissions) if user else frozenset()
+        principal = Principal(user.username if user else None, perms)
+        request.state.principal = principal
+    return principal
+
+
 def require_permission(request: Request, permission: str) -> None:
-    username = request.session.get("user")
-    if not username or not user_store.get(username):
+    principal = get_principal(request)
+    if not principal.username:
         request.session.clear()
         raise HTTPException(
             status_code=303, headers={"Location": relative_url_for(request, "login")}
         )
-    if not user_store.has_permission(username, permission):
+    if not principal.has(permission):
         request.session["flash"] = "You are not allowed to perform that action."
         raise HTTPException(
             status_code=303, headers={"Location": relative_url_for(request, "index")}
@@ -411,22 +527,29 @@ def server_version() -> str:
         return "Unknown"
 
 
-def can_edit_entry(username: str, entry: CalendarEntry) -> bool:
-    if not username or not has_unfinished_instances(entry):
+def can_edit_entry(principal: Principal, entry: CalendarEntry) -> bool:
+    if not principal.username or not has_unfinished_instances(entry):
         return False
-    if username in entry.managers:
+    if principal.username in entry.managers:
         return True
-    return user_store.has_permission(username, "admin")
+    return "admin" in principal.perms
 
 
 def split_entry_if_past(
-    entry_id: int, entry: CalendarEntry, now: datetime | None = None
+    entry_id: int,
+    entry: CalendarEntry,
+    now: datetime | None = None,
+    has_past: bool | None = None,
 ) -> tuple[int, CalendarEntry, bool]:
     """Split ``entry`` at the start of the first unfinished instance.
 
     Returns ``(new_id, entry_obj, did_split)`` where ``entry_obj`` is the
-    original entry if no split occurred or the new entry if it did.
+    original entry if no split occurred or the new entry if it did.  Callers
+    that already know whether the entry has finished instances can pass
+    ``has_past`` to skip re-enumerating the time periods when there are none.
     """
+    if has_past is False:
+        return entry_id, entry, False
     if now is None:
         now = get_now()
     past_found = False
@@ -446,15 +569,35 @@ def split_entry_if_past(
     return entry_id, entry, False
 
 
+# Mutation fields that can change which instances exist or when they occur.
+# Mutations touching only other fields (title, description, responsible,
+# managers) cannot affect whether an entry has finished instances, so the
+# post-mutation re-check can be skipped for them.
+TEMPORAL_FIELDS = {
+    "type",
+    "first_start",
+    "duration_seconds",
+    "none_after",
+    "none_before",
+}
+
+
 def require_entry_read_permission(request: Request, entry_type: CalendarEntryType) -> None:
     require_permission(request, READ_PERMS[entry_type])
 
 
 def require_entry_write_permission(request: Request, entry: CalendarEntry) -> None:
-    username = request.session.get("user")
-    if not can_edit_entry(username, entry):
+    # can_edit_entry enumerates the entry's instances, so remember entries
+    # already cleared during this request (mirrors get_principal's caching).
+    granted = getattr(request.state, "write_permitted", None)
+    if granted is None:
+        granted = request.state.write_permitted = set()
+    if entry.id in granted:
+        return
+    if not can_edit_entry(get_principal(request), entry):
         request.session["flash"] = "You are not allowed to perform that action."
         raise HTTPException(status_code=303, headers={"Location": relative_url_for(request, "index")})
+    granted.add(entry.id)
 
 
 class EnsureUserMiddleware(BaseHTTPMiddleware):
@@ -559,15 +702,24 @@ async def index(request: Request):
     counter = count()
     single_map: dict[int, bool] = {}
 
-    for entry in calendar_store.list_entries():
+    entries = calendar_store.list_entries()
+    # One query for every chore's completions instead of one per period.
+    completions_by_key = {
+        (comp.entry_id, comp.recurrence_id, comp.instance_index): comp
+        for comps in completion_store.list_for_entries(
+            e.id for e in entries if e.type == CalendarEntryType.Chore
+        ).values()
+        for comp in comps
+    }
+    for entry in entries:
         single = has_single_instance(entry)
         single_map[entry.id] = single
         gen = enumerate_time_periods(entry)
         for period in gen:
             completion = None
             if entry.type == CalendarEntryType.Chore:
-                completion = completion_store.get(
-                    entry.id, period.recurrence_id, period.instance_index
+                completion = completions_by_key.get(
+                    (entry.id, period.recurrence_id, period.instance_index)
                 )
                 if completion:
                     visible_end = min(
@@ -878,12 +1030,24 @@ async def create_calendar_entry(request: Request):
     rec_del_json = form.getlist("recurrence_delegations[]")
 
     recurrences = []
-    for i, rtype in enumerate(recurrence_types):
-        start_str = (
-            rec_first_starts[i]
-            if i < len(rec_first_starts) and rec_first_starts[i]
-            else first_start_fallback
-        )
+    rec_fields = zip_longest(
+        recurrence_types,
+        rec_first_starts,
+        rec_dur_days,
+        rec_dur_hours,
+        rec_dur_minutes,
+        rec_resp_json,
+        rec_del_json,
+        fillvalue="",
+    )
+    for i, (rtype, start_str, days_str, hours_str, minutes_str, resp_json, del_json) in enumerate(rec_fields):
+        if not rtype:
+            # A data-bearing row without a type means the form's parallel
+            # arrays are out of sync; reject instead of dropping the row.
+            if any((start_str, days_str, hours_str, minutes_str, resp_json, del_json)):
+                raise HTTPException(status_code=400, detail="Mismatched recurrence fields")
+            break
+        start_str = start_str or first_start_fallback
         if not start_str:
             raise HTTPException(status_code=400, detail="first_start required")
         start = parse_datetime(start_str)
@@ -891,21 +1055,23 @@ async def create_calendar_entry(request: Request):
         if use_fallback_duration:
             dur = duration_fallback
         else:
-            d = int(rec_dur_days[i]) if i < len(rec_dur_days) and rec_dur_days[i] else 0
-            h = int(rec_dur_hours[i]) if i < len(rec_dur_hours) and rec_dur_hours[i] else 0
-            m = int(rec_dur_minutes[i]) if i < len(rec_dur_minutes) and rec_dur_minutes[i] else 0
-            dur = timedelta(days=d, hours=h, minutes=m)
+            try:
+                dur = timedelta(
+                    days=int(days_str) if days_str else 0,
+                    hours=int(hours_str) if hours_str else 0,
+                    minutes=int(minutes_str) if minutes_str else 0,
+                )
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid duration")
         if dur <= timedelta(0):
             raise HTTPException(status_code=400, detail="Duration must be greater than 0")
 
-        responsible_users: list[str] = []
-        if i < len(rec_resp_json) and rec_resp_json[i]:
-            responsible_users = json.loads(rec_resp_json[i])
-        delegations: list[Delegation] = []
-        if i < len(rec_del_json) and rec_del_json[i]:
-            delegations = [
-                Delegation.model_validate(d) for d in json.loads(rec_del_json[i])
-            ]
+        responsible_users: list[str] = json.loads(resp_json) if resp_json else []
+        delegations: list[Delegation] = (
+            [Delegation.model_validate(d) for d in json.loads(del_json)]
+            if del_json
+            else []
+        )
         rec = Recurrence(
             id=i,
             type=RecurrenceType(rtype),
@@ -950,7 +1116,7 @@ async def create_calendar_entry(request: Request):
         managers=managers,
     )
     if (
-        not user_store.has_permission(current_user, "admin")
+        not get_principal(request).has("admin")
         and has_finished_instances(entry)
     ):
         raise HTTPException(status_code=400, detail="Cannot create entry in the past")
@@ -976,7 +1142,7 @@ async def list_calendar_entries(request: Request, entry_type: str):
         start, end = entry_time_bounds(entry)
         start_map[entry.id] = start
         can_delete_map[entry.id] = (
-            not completion_store.list_for_entry(entry.id)
+            not completion_store.has_any(entry.id)
             and not any(
                 any(spec.responsible for spec in rec.instance_specifics.values())
                 for rec in entry.recurrences
@@ -989,8 +1155,8 @@ async def list_calendar_entries(request: Request, entry_type: str):
             active_entries.append(entry)
         else:
             past_entries.append(entry)
-    active_entries.sort(key=lambda e: start_map[e.id], reverse=True)
-    past_entries.sort(key=lambda e: start_map[e.id], reverse=True)
+    active_entries = _sort_by_start(active_entries, start_map)
+    past_entries = _sort_by_start(past_entries, start_map)
     current_user = request.session.get("user")
     return templates.TemplateResponse(
         request,
@@ -1044,11 +1210,12 @@ async def list_chore_completions(
     today_list = []
     yesterday_list = []
     earlier_list = []
+    entries_by_id = calendar_store.get_many({c.entry_id for c in comps})
     for comp in comps:
         comp.completed_at = ensure_tz(comp.completed_at)
         if comp.completed_at > now and comp.completed_at.date() != today:
             continue
-        entry = calendar_store.get(comp.entry_id)
+        entry = entries_by_id.get(comp.entry_id)
         if not entry:
             continue
         has_note = bool(
@@ -1082,17 +1249,16 @@ async def view_calendar_entry(
     entry_end_display = (
         format_range_end(entry_start, entry_end) if entry_end else "Never"
     )
-    prev_entry = (
-        calendar_store.get(entry.previous_entry) if entry.previous_entry else None
-    )
-    next_entry = (
-        calendar_store.get(entry.next_entry) if entry.next_entry else None
-    )
-    current_user = request.session.get("user")
+    neighbors = calendar_store.get_many((entry.previous_entry, entry.next_entry))
+    prev_entry = neighbors.get(entry.previous_entry)
+    next_entry = neighbors.get(entry.next_entry)
+    principal = get_principal(request)
+    current_user = principal.username
     now = get_now()
     historical = entry_end is not None and ensure_tz(entry_end) < now
     comps_list = completion_store.list_for_entry(entry_id)
     comp_map = {(c.recurrence_id, c.instance_index): c for c in comps_list}
+    can_override = principal.has("chores.override_complete")
     completion_periods: list[
         tuple[TimePeriod, ChoreCompletion, bool, bool, list[str], bool]
     ] = []
@@ -1102,9 +1268,7 @@ async def view_calendar_entry(
         )
         if not period:
             continue
-        can_remove = comp.completed_by == current_user or user_store.has_permission(
-            current_user, "chores.override_complete"
-        )
+        can_remove = comp.completed_by == current_user or can_override
         is_skipped = is_instance_skipped(
             entry, comp.recurrence_id, comp.instance_index
         )
@@ -1148,9 +1312,12 @@ async def view_calendar_entry(
             else:
                 break
     past_instances = past_noncompleted + completion_periods
-    past_instances.sort(key=lambda x: x[0].start)
-    past_instances = past_instances[-past_entries:]
-    upcoming.sort(key=lambda x: x[0].start)
+    decorated = [(item[0].start, item) for item in past_instances]
+    decorated.sort(key=itemgetter(0))
+    past_instances = [item for _, item in decorated[-past_entries:]]
+    decorated = [(item[0].start, item) for item in upcoming]
+    decorated.sort(key=itemgetter(0))
+    upcoming = [item for _, item in decorated]
     can_delete = (
         not comps_list
         and not any(
@@ -1164,7 +1331,7 @@ async def view_calendar_entry(
         "calendar/view.html",
         {
             "entry": entry,
-            "can_edit": can_edit_entry(current_user, entry),
+            "can_edit": can_edit_entry(principal, entry),
             "can_delete": can_delete,
             "past_instances": past_instances,
             "upcoming_instances": upcoming,
@@ -1203,7 +1370,7 @@ async def view_time_period(
     if entry.type == CalendarEntryType.Chore:
         completion = completion_store.get(entry_id, recurrence_id, iindex)
     is_skipped = False
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     base_duration = None
     if rec:
         is_skipped = is_instance_skipped(entry, recurrence_id, iindex)
@@ -1217,7 +1384,7 @@ async def view_time_period(
     )
     start_obj = find_instance_start(entry, recurrence_id, iindex)
     start_override = ensure_tz(start_obj.start) if start_obj else None
-    current_user = request.session.get("user")
+    principal = get_principal(request)
     now = get_now()
     period_start_display = format_range_start(period.start)
     period_end_display = (
@@ -1225,12 +1392,11 @@ async def view_time_period(
         if period.end is not None
         else "Never"
     )
-    can_edit_start = (
-        can_edit_entry(current_user, entry) and ensure_tz(period.end) > now
-    )
+    can_edit = can_edit_entry(principal, entry)
+    can_edit_start = can_edit and ensure_tz(period.end) > now
     can_remove_start = False
     if can_edit_start and start_override is not None:
-        rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+        rec = get_recurrence(entry, recurrence_id)
         if rec:
             spec = rec.instance_specifics.get(iindex)
             if spec:
@@ -1252,7 +1418,7 @@ async def view_time_period(
             "period": period,
             "completion": completion,
             "is_skipped": is_skipped,
-            "can_edit": can_edit_entry(current_user, entry),
+            "can_edit": can_edit,
             "now": now,
             "CalendarEntryType": CalendarEntryType,
             "responsible": responsible_for(entry, recurrence_id, iindex),
@@ -1328,13 +1494,26 @@ async def update_calendar_entry(request: Request, entry_id: int):
     rec_del_json = form.getlist("recurrence_delegations[]")
 
     recurrences = []
-    for i, rtype in enumerate(recurrence_types):
-        rid = int(rec_ids[i]) if i < len(rec_ids) and rec_ids[i] else i
-        start_str = (
-            rec_first_starts[i]
-            if i < len(rec_first_starts) and rec_first_starts[i]
-            else first_start_fallback
-        )
+    rec_fields = zip_longest(
+        recurrence_types,
+        rec_ids,
+        rec_first_starts,
+        rec_dur_days,
+        rec_dur_hours,
+        rec_dur_minutes,
+        rec_resp_json,
+        rec_del_json,
+        fillvalue="",
+    )
+    for i, (rtype, rid_str, start_str, days_str, hours_str, minutes_str, resp_json, del_json) in enumerate(rec_fields):
+        if not rtype:
+            # A data-bearing row without a type means the form's parallel
+            # arrays are out of sync; reject instead of dropping the row.
+            if any((rid_str, start_str, days_str, hours_str, minutes_str, resp_json, del_json)):
+                raise HTTPException(status_code=400, detail="Mismatched recurrence fields")
+            break
+        rid = int(rid_str) if rid_str else i
+        start_str = start_str or first_start_fallback
         if not start_str:
             raise HTTPException(status_code=400, detail="first_start required")
         start = parse_datetime(start_str)
@@ -1342,21 +1521,23 @@ async def update_calendar_entry(request: Request, entry_id: int):
         if use_fallback_duration:
             dur = duration_fallback
         else:
-            d = int(rec_dur_days[i]) if i < len(rec_dur_days) and rec_dur_days[i] else 0
-            h = int(rec_dur_hours[i]) if i < len(rec_dur_hours) and rec_dur_hours[i] else 0
-            m = int(rec_dur_minutes[i]) if i < len(rec_dur_minutes) and rec_dur_minutes[i] else 0
-            dur = timedelta(days=d, hours=h, minutes=m)
+            try:
+                dur = timedelta(
+                    days=int(days_str) if days_str else 0,
+                    hours=int(hours_str) if hours_str else 0,
+                    minutes=int(minutes_str) if minutes_str else 0,
+                )
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid duration")
         if dur <= timedelta(0):
             raise HTTPException(status_code=400, detail="Duration must be greater than 0")
 
-        responsible_users: list[str] = []
-        if i < len(rec_resp_json) and rec_resp_json[i]:
-            responsible_users = json.loads(rec_resp_json[i])
-        delegations: list[Delegation] = []
-        if i < len(rec_del_json) and rec_del_json[i]:
-            delegations = [
-                Delegation.model_validate(d) for d in json.loads(rec_del_json[i])
-            ]
+        responsible_users: list[str] = json.loads(resp_json) if resp_json else []
+        delegations: list[Delegation] = (
+            [Delegation.model_validate(d) for d in json.loads(del_json)]
+            if del_json
+            else []
+        )
         rec = Recurrence(
             id=rid,
             type=RecurrenceType(rtype),
@@ -1436,6 +1617,7 @@ async def inline_update_calendar_entry(request: Request, entry_id: int):
     require_entry_write_permission(request, entry)
     if not has_unfinished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
+    has_past = has_finished_instances(entry)
     data = await request.json()
     split_fields = {
         "description",
@@ -1444,7 +1626,7 @@ async def inline_update_calendar_entry(request: Request, entry_id: int):
     }
     did_split = False
     if split_fields & set(data.keys()):
-        entry_id, entry, did_split = split_entry_if_past(entry_id, entry)
+        entry_id, entry, did_split = split_entry_if_past(entry_id, entry, has_past=has_past)
 
     if "description" in data:
         entry.description = data["description"].strip()
@@ -1465,7 +1647,7 @@ async def inline_update_calendar_entry(request: Request, entry_id: int):
         if not managers:
             raise HTTPException(status_code=400, detail="At least one manager required")
         entry.managers = managers
-    if has_finished_instances(entry):
+    if TEMPORAL_FIELDS & data.keys() and has_finished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
     calendar_store.update(entry_id, entry)
     resp = {"status": "ok"}
@@ -1484,13 +1666,14 @@ async def update_recurrence(request: Request, entry_id: int):
     require_entry_write_permission(request, entry)
     if not has_unfinished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
+    has_past = has_finished_instances(entry)
     data = await request.json()
     rid = int(data.get("recurrence_id", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    entry_id, entry, did_split = split_entry_if_past(entry_id, entry)
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    entry_id, entry, did_split = split_entry_if_past(entry_id, entry, has_past=has_past)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
     if "type" in data:
@@ -1501,7 +1684,7 @@ async def update_recurrence(request: Request, entry_id: int):
         rec.duration_seconds = int(data["duration_seconds"])
     if "responsible" in data:
         rec.responsible = list(data["responsible"])
-    if has_finished_instances(entry):
+    if TEMPORAL_FIELDS & data.keys() and has_finished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
     calendar_store.update(entry_id, entry)
     resp = {"status": "ok"}
@@ -1520,10 +1703,11 @@ async def add_recurrence(request: Request, entry_id: int):
     require_entry_write_permission(request, entry)
     if not has_unfinished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
+    has_past = has_finished_instances(entry)
     data = await request.json()
     if "type" not in data or "first_start" not in data or "duration_seconds" not in data:
         raise HTTPException(status_code=400)
-    entry_id, entry, did_split = split_entry_if_past(entry_id, entry)
+    entry_id, entry, did_split = split_entry_if_past(entry_id, entry, has_past=has_past)
     rid = max((r.id for r in entry.recurrences), default=-1) + 1
     rec = Recurrence(
         id=rid,
@@ -1533,7 +1717,7 @@ async def add_recurrence(request: Request, entry_id: int):
         responsible=list(data.get("responsible") or []),
     )
     entry.recurrences.append(rec)
-    if has_finished_instances(entry):
+    if TEMPORAL_FIELDS & data.keys() and has_finished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
     calendar_store.update(entry_id, entry)
     resp = {"status": "ok", "recurrence_id": rid}
@@ -1552,21 +1736,19 @@ async def delete_recurrence(request: Request, entry_id: int):
     require_entry_write_permission(request, entry)
     if not has_unfinished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
+    has_past = has_finished_instances(entry)
     data = await request.json()
     rid = int(data.get("recurrence_id", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    entry_id, entry, did_split = split_entry_if_past(entry_id, entry)
+    entry_id, entry, did_split = split_entry_if_past(entry_id, entry, has_past=has_past)
     entry.recurrences = [r for r in entry.recurrences if r.id != rid]
-    if has_finished_instances(entry):
+    if TEMPORAL_FIELDS & data.keys() and has_finished_instances(entry):
         raise HTTPException(status_code=400, detail="Cannot modify entry with past instances")
     calendar_store.update(entry_id, entry)
     # Remove completions for this recurrence
-    comps = completion_store.list_for_entry(entry_id)
-    for comp in comps:
-        if comp.recurrence_id == rid:
-            completion_store.delete(entry_id, comp.recurrence_id, comp.instance_index)
+    completion_store.delete_for_recurrence(entry_id, rid)
     resp = {"status": "ok"}
     if did_split:
         resp["redirect"] = str(
@@ -1612,8 +1794,9 @@ async def complete_chore(request: Request, entry_id: int):
         perm = "chores.complete_overdue"
     else:
         raise HTTPException(status_code=403)
-    user = request.session.get("user")
-    if not user_store.has_permission(user, perm):
+    principal = get_principal(request)
+    user = principal.username
+    if not principal.has(perm):
         return JSONResponse(
             {
                 "status": "forbidden",
@@ -1638,10 +1821,10 @@ async def remove_completion(request: Request, entry_id: int):
     completion = completion_store.get(entry_id, rid, iindex)
     if not completion:
         raise HTTPException(status_code=404)
-    user = request.session.get("user")
+    principal = get_principal(request)
     if not (
-        completion.completed_by == user
-        or user_store.has_permission(user, "chores.override_complete")
+        completion.completed_by == principal.username
+        or principal.has("chores.override_complete")
     ):
         raise HTTPException(status_code=403)
     completion_store.delete(entry_id, rid, iindex)
@@ -1660,15 +1843,9 @@ async def delegate_instance(request: Request, entry_id: int):
     responsible = form.getlist("responsible[]")
     if rid < 0 or not responsible:
         raise HTTPException(status_code=400)
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if not rec:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
@@ -1685,19 +1862,7 @@ async def delegate_instance(request: Request, entry_id: int):
     specs[iindex] = spec
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/delegation/remove")
@@ -1709,15 +1874,9 @@ async def remove_delegation(request: Request, entry_id: int):
     form = await request.form()
     rid = int(form.get("recurrence_id", -1))
     iindex = int(form.get("instance_index", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
@@ -1727,22 +1886,10 @@ async def remove_delegation(request: Request, entry_id: int):
         if spec.has_overrides():
             specs[iindex] = spec
         else:
-            del specs[iindex]
+            specs.pop(iindex)
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/start")
@@ -1816,15 +1963,9 @@ async def set_instance_start(request: Request, entry_id: int):
                 f"Cannot start this instance after the next instance's start of {next_any.start.strftime(fmt)}"
             ),
         )
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400, detail="Recurrence not found")
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
@@ -1841,19 +1982,7 @@ async def set_instance_start(request: Request, entry_id: int):
     specs[iindex] = spec
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/start/remove")
@@ -1870,20 +1999,12 @@ async def remove_instance_start(request: Request, entry_id: int):
         raise HTTPException(status_code=400, detail="Instance not found")
     if ensure_tz(period.end) <= get_now():
         raise HTTPException(status_code=400, detail="Cannot edit an instance that has ended")
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400, detail="Recurrence not found")
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         orig_start = spec.start
         spec.start = None
         base_period = find_time_period(entry, rid, iindex, include_skipped=True)
@@ -1897,22 +2018,10 @@ async def remove_instance_start(request: Request, entry_id: int):
         if spec.has_overrides():
             specs[iindex] = spec
         else:
-            del specs[iindex]
+            specs.pop(iindex)
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/duration")
@@ -1938,20 +2047,12 @@ async def set_instance_duration(request: Request, entry_id: int):
     if duration <= timedelta(0):
         raise HTTPException(status_code=400)
     seconds = int(duration.total_seconds())
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         spec.duration_seconds = seconds
     else:
         spec = InstanceSpecifics(
@@ -1963,19 +2064,7 @@ async def set_instance_duration(request: Request, entry_id: int):
     specs[iindex] = spec
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/duration/remove")
@@ -1987,40 +2076,20 @@ async def remove_instance_duration(request: Request, entry_id: int):
     form = await request.form()
     rid = int(form.get("recurrence_id", -1))
     iindex = int(form.get("instance_index", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         spec.duration_seconds = None
         if spec.has_overrides():
             specs[iindex] = spec
         else:
-            del specs[iindex]
+            specs.pop(iindex)
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/note")
@@ -2035,20 +2104,12 @@ async def add_instance_note(request: Request, entry_id: int):
     note = (form.get("note", "").strip())
     if not note:
         raise HTTPException(status_code=400)
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         spec.note = note
     else:
         spec = InstanceSpecifics(
@@ -2060,19 +2121,7 @@ async def add_instance_note(request: Request, entry_id: int):
     specs[iindex] = spec
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/note/remove")
@@ -2084,40 +2133,20 @@ async def remove_instance_note(request: Request, entry_id: int):
     form = await request.form()
     rid = int(form.get("recurrence_id", -1))
     iindex = int(form.get("instance_index", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
-    if not isinstance(rec, Recurrence):
-        rec = Recurrence.model_validate(rec)
-        for idx, r in enumerate(entry.recurrences):
-            if r.id == rid:
-                entry.recurrences[idx] = rec
-                break
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         spec.note = None
         if spec.has_overrides():
             specs[iindex] = spec
         else:
-            del specs[iindex]
+            specs.pop(iindex)
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/skip")
@@ -2129,37 +2158,23 @@ async def skip_instance(request: Request, entry_id: int):
     form = await request.form()
     rid = int(form.get("recurrence_id", -1))
     iindex = int(form.get("instance_index", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
     specs = rec.instance_specifics
     spec = specs.get(iindex)
-    if not spec:
-        spec = InstanceSpecifics(
-            entry_id=entry_id, recurrence_id=rid, instance_index=iindex, skip=True
-        )
-    else:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
+    if spec:
         spec.skip = True
         spec.responsible = None
         spec.note = None
+    else:
+        spec = InstanceSpecifics(
+            entry_id=entry_id, recurrence_id=rid, instance_index=iindex, skip=True
+        )
     specs[iindex] = spec
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.post("/calendar/{entry_id}/skip/remove")
@@ -2171,14 +2186,12 @@ async def unskip_instance(request: Request, entry_id: int):
     form = await request.form()
     rid = int(form.get("recurrence_id", -1))
     iindex = int(form.get("instance_index", -1))
-    rec = next((r for r in entry.recurrences if r.id == rid), None)
+    rec = get_recurrence(entry, rid)
     if rec is None:
         raise HTTPException(status_code=400)
     specs = rec.instance_specifics
     spec = specs.get(iindex)
     if spec:
-        if not isinstance(spec, InstanceSpecifics):
-            spec = InstanceSpecifics.model_validate(spec)
         spec.skip = False
         if spec.has_overrides():
             specs[iindex] = spec
@@ -2186,38 +2199,22 @@ async def unskip_instance(request: Request, entry_id: int):
             specs.pop(iindex)
     rec.instance_specifics = specs
     calendar_store.update(entry_id, entry)
-    referer = request.headers.get(
-        "referer",
-        str(
-            relative_url_for(
-                request,
-                "view_time_period",
-                entry_id=entry_id,
-                recurrence_id=rid,
-                iindex=iindex,
-            )
-        ),
-    )
-    return RedirectResponse(url=referer, status_code=303)
+    return redirect_to_instance(request, entry_id, rid, iindex)
 
 
 @app.get("/users", response_class=HTMLResponse)
 async def list_users(request: Request):
     require_permission(request, "iam")
     users = user_store.list_users()
-    entries = calendar_store.list_entries()
+    index = calendar_store.user_index()
     with Session(engine) as session:
-        completion_users = {
-            row[0] for row in session.exec(select(ChoreCompletion.completed_by)).all()
-        }
-    undeletable = {
-        u.username
-        for u in users
-        if any(
-            u.username in e.managers or u.username in e.responsible for e in entries
+        completion_users = set(
+            session.exec(select(ChoreCompletion.completed_by).distinct()).all()
         )
-        or u.username in completion_users
-    }
+    referenced: set[str] = set(completion_users)
+    referenced.update(index.managed)
+    referenced.update(index.responsible)
+    undeletable = {u.username for u in users if u.username in referenced}
     return templates.TemplateResponse(
         request,
         "users/list.html",
@@ -2234,24 +2231,25 @@ async def new_user(request: Request):
 @app.post("/users/new")
 async def create_user(request: Request):
     require_permission(request, "iam")
-    form = await request.form()
+    form = await request.form(max_part_size=MAX_UPLOAD_PART_SIZE)
     username = form.get("username", "").strip()
-    password = form.get("password") or None
-    pin = form.get("pin") or None
-    permissions = {p for p in ALL_PERMISSIONS if form.get(p)}
-    if form.get("admin") and user_store.has_permission(request.session.get("user"), "admin"):
-        permissions.add("admin")
-    upload = form.get("profile_picture")
-    profile_picture = None
-    if getattr(upload, "filename", ""):
-        data = await upload.read()
-        if data:
-            profile_picture = process_profile_picture(data)
     if not is_url_safe(username):
         request.session["flash"] = "Username must be URL-safe."
         raise HTTPException(
             status_code=303, headers={"Location": relative_url_for(request, "new_user")}
         )
+    password = form.get("password") or None
+    pin = form.get("pin") or None
+    permissions = set(form.keys()) & ALL_PERMISSIONS_SET
+    if form.get("admin") and get_principal(request).has("admin"):
+        permissions.add("admin")
+    upload = form.get("profile_picture")
+    profile_picture = None
+    if getattr(upload, "filename", "") and upload.size:
+        # Starlette spools large uploads to disk, so hand the file object
+        # straight to Pillow instead of buffering the payload as bytes.
+        # The resizing itself is CPU-bound; keep it off the event loop.
+        profile_picture = await asyncio.to_thread(process_profile_picture, upload.file)
     if not user_store.create(
         username, password, pin, permissions, profile_picture=profile_picture
     ):
@@ -2277,37 +2275,49 @@ async def view_user(request: Request, username: str):
             .order_by(ChoreCompletion.completed_at.desc())
         )
         comps = session.exec(stmt).all()
+    comp_entries_by_id = calendar_store.get_many({c.entry_id for c in comps})
     completion_entries = []
     for comp in comps:
-        entry = calendar_store.get(comp.entry_id)
+        entry = comp_entries_by_id.get(comp.entry_id)
         if entry:
             has_note = bool(
                 find_instance_note(entry, comp.recurrence_id, comp.instance_index)
             )
             completion_entries.append((entry, comp, has_note))
-    entries = calendar_store.list_entries()
+    index = calendar_store.user_index()
+    responsible_ids = index.responsible.get(username, set()) | index.recurrence_responsible.get(username, set())
+    managed_ids = index.managed.get(username, set())
+    entries_by_id = calendar_store.get_many(responsible_ids | managed_ids)
+    # Shallow copies so title disambiguation below doesn't mutate the shared
+    # entry; nothing here touches the nested fields.
     responsible_entries = [
-        CalendarEntry.model_validate(e.model_dump())
-        for e in entries
-        if (username in e.responsible)
-        or any(username in r.responsible for r in e.recurrences)
+        entries_by_id[eid].model_copy()
+        for eid in sorted(responsible_ids)
+        if eid in entries_by_id
     ]
     managed_entries = [
-        CalendarEntry.model_validate(e.model_dump())
-        for e in entries
-        if username in e.managers
+        entries_by_id[eid].model_copy()
+        for eid in sorted(managed_ids)
+        if eid in entries_by_id
     ]
 
+    bounds_map: dict[int, tuple[datetime, datetime | None]] = {}
+
     def _prep(entries_list: list[CalendarEntry]) -> list[CalendarEntry]:
-        counts = Counter(e.title for e in entries_list)
+        by_title: dict[str, list[tuple[CalendarEntry, datetime, datetime | None]]] = defaultdict(list)
         start_map = {}
         for e in entries_list:
-            start, end = entry_time_bounds(e)
+            bounds = bounds_map.get(e.id)
+            if bounds is None:
+                bounds = bounds_map[e.id] = entry_time_bounds(e)
+            start, end = bounds
             start_map[e.id] = start
-            if counts[e.title] > 1:
-                e.title = f"{e.title} ({time_range_summary(start, end)})"
-        entries_list.sort(key=lambda e: start_map[e.id], reverse=True)
-        return entries_list
+            by_title[e.title].append((e, start, end))
+        for group in by_title.values():
+            if len(group) > 1:
+                for e, start, end in group:
+                    e.title = f"{e.title} ({time_range_summary(start, end)})"
+        return _sort_by_start(entries_list, start_map)
 
     responsible_entries = _prep(responsible_entries)
     managed_entries = _prep(managed_entries)
@@ -2341,18 +2351,8 @@ async def update_user(request: Request, username: str):
     current_user = request.session.get("user")
     if current_user != username:
         require_permission(request, "iam")
-    form = await request.form()
+    form = await request.form(max_part_size=MAX_UPLOAD_PART_SIZE)
     new_username = form.get("username", "").strip()
-    password = form.get("password") or None
-    pin = form.get("pin") or None
-    remove_password = bool(form.get("remove_password"))
-    remove_pin = bool(form.get("remove_pin"))
-    upload = form.get("profile_picture")
-    profile_picture = None
-    if getattr(upload, "filename", ""):
-        data = await upload.read()
-        if data:
-            profile_picture = process_profile_picture(data)
     existing = user_store.get(username)
     if not existing or existing.username == "Viewer":
         raise HTTPException(status_code=404)
@@ -2362,15 +2362,26 @@ async def update_user(request: Request, username: str):
             status_code=303,
             headers={"Location": relative_url_for(request, "edit_user", username=username)},
         )
-    if user_store.has_permission(current_user, "iam"):
-        permissions = {p for p in ALL_PERMISSIONS if form.get(p)}
-        if form.get("admin") and user_store.has_permission(current_user, "admin"):
+    password = form.get("password") or None
+    pin = form.get("pin") or None
+    remove_password = bool(form.get("remove_password"))
+    remove_pin = bool(form.get("remove_pin"))
+    upload = form.get("profile_picture")
+    profile_picture = None
+    if getattr(upload, "filename", "") and upload.size:
+        # Starlette spools large uploads to disk, so hand the file object
+        # straight to Pillow instead of buffering the payload as bytes.
+        # The resizing itself is CPU-bound; keep it off the event loop.
+        profile_picture = await asyncio.to_thread(process_profile_picture, upload.file)
+    principal = get_principal(request)
+    if principal.has("iam"):
+        permissions = set(form.keys()) & ALL_PERMISSIONS_SET
+        if form.get("admin") and principal.has("admin"):
             permissions.add("admin")
         elif "admin" in existing.permissions:
             permissions.add("admin")
         if "admin" in existing.permissions and "admin" not in permissions:
-            admins = [u for u in user_store.list_users() if "admin" in u.permissions and u.username != username]
-            if not admins:
+            if user_store.admin_count() <= 1:
                 request.session["flash"] = "Cannot remove the last admin user."
                 raise HTTPException(
                     status_code=303,
@@ -2393,6 +2404,9 @@ async def update_user(request: Request, username: str):
             status_code=303,
             headers={"Location": relative_url_for(request, "edit_user", username=username)},
         )
+    if new_username != username:
+        # The rename rewrote entry references outside the calendar store.
+        calendar_store.invalidate_user_index()
     if current_user == username:
         request.session["user"] = new_username
     target = (
@@ -2410,16 +2424,19 @@ async def delete_user(request: Request, username: str):
     if not user or user.username == "Viewer":
         raise HTTPException(status_code=404)
     if "admin" in user.permissions:
-        admins = [u for u in user_store.list_users() if "admin" in u.permissions and u.username != username]
-        if not admins:
+        if user_store.admin_count() <= 1:
             request.session["flash"] = "Cannot delete the last admin user."
             raise HTTPException(status_code=303, headers={"Location": relative_url_for(request, "list_users")})
-    for entry in calendar_store.list_entries():
-        if username in entry.managers or username in entry.responsible:
-            request.session["flash"] = "Cannot delete user with calendar responsibilities."
-            raise HTTPException(status_code=303, headers={"Location": relative_url_for(request, "list_users")})
+    index = calendar_store.user_index()
+    if index.managed.get(username) or index.responsible.get(username):
+        request.session["flash"] = "Cannot delete user with calendar responsibilities."
+        raise HTTPException(status_code=303, headers={"Location": relative_url_for(request, "list_users")})
     with Session(engine) as session:
-        stmt = select(ChoreCompletion).where(ChoreCompletion.completed_by == username)
+        stmt = (
+            select(ChoreCompletion.id)
+            .where(ChoreCompletion.completed_by == username)
+            .limit(1)
+        )
         if session.exec(stmt).first():
             request.session["flash"] = "Cannot delete user with chore completions."
             raise HTTPException(status_code=303, headers={"Location": relative_url_for(request, "list_users")})
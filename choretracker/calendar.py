@@ -3,12 +3,21 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
-from heapq import heappush, heappop
+from heapq import heapify, heappop, heapreplace
 import calendar as cal
-from typing import Iterator, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 from sqlmodel import Column, Field, Session, SQLModel, select
-from sqlalchemy import JSON, ForeignKey, Integer, delete
+from sqlalchemy import (
+    JSON,
+    ForeignKey,
+    Index,
+    Integer,
+    bindparam,
+    delete,
+    tuple_,
+    update,
+)
 
 from .time_utils import get_now, ensure_tz
 
@@ -73,6 +82,9 @@ class CalendarEntry(SQLModel, table=True):
     next_entry: Optional[int] = Field(
         default=None, foreign_key="calendarentry.id"
     )
+    # Bumped on every store write; lets read paths cache derived values
+    # (e.g. time bounds) keyed on (id, updated_at).
+    updated_at: Optional[datetime] = None
 
 
 class InstanceSpecifics(SQLModel, table=True):
@@ -103,10 +115,9 @@ class InstanceSpecifics(SQLModel, table=True):
 Recurrence.model_rebuild()
 
 
-def _load_instance_specifics(session: Session, entry: CalendarEntry) -> None:
-    specs = session.exec(
-        select(InstanceSpecifics).where(InstanceSpecifics.entry_id == entry.id)
-    ).all()
+def _apply_instance_specifics(
+    entry: CalendarEntry, specs: Iterable[InstanceSpecifics]
+) -> None:
     rec_map = {rec.id: rec for rec in entry.recurrences}
     for spec in specs:
         rec = rec_map.get(spec.recurrence_id)
@@ -117,8 +128,27 @@ def _load_instance_specifics(session: Session, entry: CalendarEntry) -> None:
         rec.instance_specifics[spec.instance_index] = loaded
 
 
+def _load_instance_specifics(session: Session, entry: CalendarEntry) -> None:
+    specs = session.exec(
+        select(InstanceSpecifics).where(InstanceSpecifics.entry_id == entry.id)
+    ).all()
+    _apply_instance_specifics(entry, specs)
+
+
 def _store_instance_specifics(session: Session, entry: CalendarEntry) -> None:
-    session.exec(delete(InstanceSpecifics).where(InstanceSpecifics.entry_id == entry.id))
+    """Sync the InstanceSpecifics table with an entry's in-memory overrides.
+
+    Rows are diffed against what is already stored so a single toggled
+    override writes one row instead of rewriting every override the entry
+    has.
+    """
+    existing = {
+        (row.recurrence_id, row.instance_index): row
+        for row in session.exec(
+            select(InstanceSpecifics).where(InstanceSpecifics.entry_id == entry.id)
+        ).all()
+    }
+    desired: dict[tuple[int, int], InstanceSpecifics] = {}
     for rec in entry.recurrences:
         for spec in rec.instance_specifics.values():
             if not isinstance(spec, InstanceSpecifics):
@@ -140,12 +170,76 @@ def _store_instance_specifics(session: Session, entry: CalendarEntry) -> None:
                 db_spec.duration_seconds = spec.duration_seconds
             if spec.start is not None:
                 db_spec.start = spec.start
-            session.add(db_spec)
+            desired[(rec.id, spec.instance_index)] = db_spec
+    for key, row in existing.items():
+        wanted = desired.pop(key, None)
+        if wanted is None:
+            session.delete(row)
+            continue
+        for field in ("skip", "duration_seconds", "responsible", "note", "start"):
+            current = getattr(row, field)
+            value = getattr(wanted, field)
+            if field == "start":
+                current = ensure_tz(current)
+            if current != value:
+                setattr(row, field, value)
+    for db_spec in desired.values():
+        session.add(db_spec)
+
+
+def _normalize_entry_fields(entry: CalendarEntry) -> None:
+    entry.recurrences = [
+        rec if isinstance(rec, Recurrence) else Recurrence.model_validate(rec)
+        for rec in entry.recurrences
+    ]
+    for rec in entry.recurrences:
+        rec.first_start = ensure_tz(rec.first_start)
+    entry.none_after = ensure_tz(entry.none_after)
+    entry.none_before = ensure_tz(entry.none_before)
+
+
+def _normalize_entry(session: Session, entry: CalendarEntry) -> None:
+    """Coerce an entry's JSON fields into models with timezone-aware times."""
+    _normalize_entry_fields(entry)
+    _load_instance_specifics(session, entry)
+
+
+def _normalize_entries(session: Session, entries: List[CalendarEntry]) -> None:
+    """Normalize many entries, loading their overrides with one query.
+
+    Per-entry normalization issues one InstanceSpecifics SELECT each; batch
+    paths like :meth:`CalendarEntryStore.list_entries` use this instead to
+    avoid the N+1 pattern.
+    """
+    for entry in entries:
+        _normalize_entry_fields(entry)
+    if not entries:
+        return
+    by_entry: dict[int, List[InstanceSpecifics]] = {}
+    specs = session.exec(
+        select(InstanceSpecifics).where(
+            InstanceSpecifics.entry_id.in_([entry.id for entry in entries])
+        )
+    ).all()
+    for spec in specs:
+        by_entry.setdefault(spec.entry_id, []).append(spec)
+    for entry in entries:
+        _apply_instance_specifics(entry, by_entry.get(entry.id, ()))
+
+
+class UserEntryIndex:
+    """Reverse index from username to the ids of entries referencing them."""
+
+    def __init__(self):
+        self.managed: dict[str, set[int]] = {}
+        self.responsible: dict[str, set[int]] = {}
+        self.recurrence_responsible: dict[str, set[int]] = {}
 
 
 class CalendarEntryStore:
     def __init__(self, engine):
         self.engine = engine
+        self._user_index: Optional[UserEntryIndex] = None
 
     def create(self, entry: CalendarEntry) -> None:
         if not entry.managers:
@@ -155,29 +249,61 @@ class CalendarEntryStore:
         with Session(self.engine) as session:
             recs = entry.recurrences
             entry.recurrences = [
-                Recurrence.model_validate(r).model_dump() for r in recs
+                (r if isinstance(r, Recurrence) else Recurrence.model_validate(r)).model_dump()
+                for r in recs
             ]
+            entry.updated_at = get_now()
             session.add(entry)
-            session.commit()
+            session.flush()  # assign entry.id for the override rows
             entry.recurrences = recs
             _store_instance_specifics(session, entry)
             session.commit()
+        self.invalidate_user_index()
+
+    def invalidate_user_index(self) -> None:
+        """Drop the cached username index after anything rewrites entries."""
+        self._user_index = None
+
+    def user_index(self) -> UserEntryIndex:
+        """Return the reverse username index, rebuilding it if invalidated."""
+        index = self._user_index
+        if index is None:
+            index = UserEntryIndex()
+            for entry in self.list_entries():
+                for username in entry.managers:
+                    index.managed.setdefault(username, set()).add(entry.id)
+                for username in entry.responsible:
+                    index.responsible.setdefault(username, set()).add(entry.id)
+                for rec in entry.recurrences:
+                    for username in rec.responsible:
+                        index.recurrence_responsible.setdefault(username, set()).add(
+                            entry.id
+                        )
+            self._user_index = index
+        return index
 
     def get(self, entry_id: int) -> Optional[CalendarEntry]:
         with Session(self.engine) as session:
             entry = session.get(CalendarEntry, entry_id)
             if entry:
-                entry.recurrences = [
-                    rec if isinstance(rec, Recurrence) else Recurrence.model_validate(rec)
-                    for rec in entry.recurrences
-                ]
-                for rec in entry.recurrences:
-                    rec.first_start = ensure_tz(rec.first_start)
-                entry.none_after = ensure_tz(entry.none_after)
-                entry.none_before = ensure_tz(entry.none_before)
-                _load_instance_specifics(session, entry)
+                _normalize_entry(session, entry)
             return entry
 
+    def get_many(self, entry_ids: Iterable[int]) -> dict[int, CalendarEntry]:
+        """Fetch several entries by id with a single SELECT.
+
+        Returns a mapping of entry id to entry; missing ids are absent.
+        """
+        ids = [eid for eid in entry_ids if eid is not None]
+        if not ids:
+            return {}
+        with Session(self.engine) as session:
+            entries = session.exec(
+                select(CalendarEntry).where(CalendarEntry.id.in_(ids))
+            ).all()
+            _normalize_entries(session, entries)
+            return {entry.id: entry for entry in entries}
+
     def update(self, entry_id: int, new_data: CalendarEntry) -> None:
         if not new_data.managers:
             raise ValueError("CalendarEntry must have at least one manager")
@@ -192,31 +318,24 @@ class CalendarEntryStore:
             entry.type = new_data.type
             recs = new_data.recurrences
             entry.recurrences = [
-                Recurrence.model_validate(r).model_dump() for r in recs
+                (r if isinstance(r, Recurrence) else Recurrence.model_validate(r)).model_dump()
+                for r in recs
             ]
             entry.none_after = new_data.none_after
             entry.none_before = new_data.none_before
             entry.responsible = new_data.responsible
             entry.managers = new_data.managers
+            entry.updated_at = get_now()
             session.add(entry)
-            session.commit()
             entry.recurrences = recs
             _store_instance_specifics(session, entry)
             session.commit()
+        self.invalidate_user_index()
 
     def list_entries(self) -> List[CalendarEntry]:
         with Session(self.engine) as session:
             entries = session.exec(select(CalendarEntry)).all()
-            for entry in entries:
-                entry.recurrences = [
-                    rec if isinstance(rec, Recurrence) else Recurrence.model_validate(rec)
-                    for rec in entry.recurrences
-                ]
-                for rec in entry.recurrences:
-                    rec.first_start = ensure_tz(rec.first_start)
-                entry.none_after = ensure_tz(entry.none_after)
-                entry.none_before = ensure_tz(entry.none_before)
-                _load_instance_specifics(session, entry)
+            _normalize_entries(session, entries)
             return entries
 
     def delete(self, entry_id: int) -> bool:
@@ -224,11 +343,7 @@ class CalendarEntryStore:
             entry = session.get(CalendarEntry, entry_id)
             if not entry:
                 return False
-            entry.recurrences = [
-                rec if isinstance(rec, Recurrence) else Recurrence.model_validate(rec)
-                for rec in entry.recurrences
-            ]
-            _load_instance_specifics(session, entry)
+            _normalize_entry(session, entry)
             first_period = next(
                 enumerate_time_periods(entry, include_skipped=True), None
             )
@@ -262,6 +377,7 @@ class CalendarEntryStore:
                 session.add(e)
             session.delete(entry)
             session.commit()
+            self.invalidate_user_index()
             return True
 
     def split(
@@ -276,24 +392,11 @@ class CalendarEntryStore:
             entry = session.get(CalendarEntry, entry_id)
             if not entry:
                 return None
-            # Ensure Recurrence objects
-            entry.recurrences = [
-                rec if isinstance(rec, Recurrence) else Recurrence.model_validate(rec)
-                for rec in entry.recurrences
-            ]
-            for rec in entry.recurrences:
-                rec.first_start = ensure_tz(rec.first_start)
-            entry.none_after = ensure_tz(entry.none_after)
-            entry.none_before = ensure_tz(entry.none_before)
-            _load_instance_specifics(session, entry)
+            _normalize_entry(session, entry)
 
             # Copy of entry for time period calculations
             original = CalendarEntry.model_validate(entry.model_dump())
-            original.recurrences = [
-                r if isinstance(r, Recurrence) else Recurrence.model_validate(r)
-                for r in original.recurrences
-            ]
-            _load_instance_specifics(session, original)
+            _normalize_entry(session, original)
 
             # Create new entry as a copy
             new_entry = CalendarEntry.model_validate(entry.model_dump())
@@ -319,6 +422,9 @@ class CalendarEntryStore:
 
             # Adjust boundaries
             last_end = None
+            # No until bound here: it clamps on nominal starts, and an
+            # early-started instance (override start before split_time,
+            # nominal start after) must still contribute to last_end.
             for period in enumerate_time_periods(
                 original, include_skipped=True
             ):
@@ -328,39 +434,50 @@ class CalendarEntryStore:
                 else:
                     break
             entry.none_after = last_end
-            
+            entry.updated_at = new_entry.updated_at = get_now()
+
             session.add(entry)
             session.add(new_entry)
-            session.commit()
+            session.flush()  # assign new_entry.id so the entries can link
 
             # Link entries
             entry.next_entry = new_entry.id
             new_entry.previous_entry = entry.id
             session.add(entry)
             session.add(new_entry)
-            session.commit()
 
-            # Ensure Recurrence objects after commit
-            entry.recurrences = [
-                r if isinstance(r, Recurrence) else Recurrence.model_validate(r)
-                for r in entry.recurrences
-            ]
-            new_entry.recurrences = [
-                r if isinstance(r, Recurrence) else Recurrence.model_validate(r)
-                for r in new_entry.recurrences
-            ]
-
-            # Move completions before storing instance specifics
-            comps = session.exec(
-                select(ChoreCompletion).where(ChoreCompletion.entry_id == entry_id)
+            # Ensure Recurrence objects after flush
+            _normalize_entry_fields(entry)
+            _normalize_entry_fields(new_entry)
+
+            # Move completions before storing instance specifics. Only the
+            # key columns are needed to decide which rows move, so fetch
+            # those and reassign the movers with one bulk UPDATE instead of
+            # materializing and re-adding every completion.
+            comp_keys = session.exec(
+                select(
+                    ChoreCompletion.recurrence_id, ChoreCompletion.instance_index
+                ).where(ChoreCompletion.entry_id == entry_id)
             ).all()
-            for comp in comps:
+            moved_keys = []
+            for rid, iindex in comp_keys:
                 period = find_time_period(
-                    original, comp.recurrence_id, comp.instance_index, include_skipped=True
+                    original, rid, iindex, include_skipped=True
                 )
                 if period and period.start >= split_time:
-                    comp.entry_id = new_entry.id
-                    session.add(comp)
+                    moved_keys.append((rid, iindex))
+            if moved_keys:
+                session.exec(
+                    update(ChoreCompletion)
+                    .where(
+                        (ChoreCompletion.entry_id == entry_id)
+                        & tuple_(
+                            ChoreCompletion.recurrence_id,
+                            ChoreCompletion.instance_index,
+                        ).in_(moved_keys)
+                    )
+                    .values(entry_id=new_entry.id)
+                )
 
             # Store instance specifics
             _store_instance_specifics(session, entry)
@@ -368,28 +485,47 @@ class CalendarEntryStore:
             session.commit()
 
             # Ensure recurrences are Recurrence objects for return
-            new_entry.recurrences = [
-                r if isinstance(r, Recurrence) else Recurrence.model_validate(r)
-                for r in new_entry.recurrences
-            ]
+            _normalize_entry_fields(new_entry)
+            self.invalidate_user_index()
             return new_entry
 
 
 class ChoreCompletion(SQLModel, table=True):
+    # Covers the (entry_id, recurrence_id, instance_index) lookups done by
+    # get/delete as well as entry_id-only queries via its prefix.
+    __table_args__ = (
+        Index(
+            "ix_chorecompletion_entry_recurrence_instance",
+            "entry_id",
+            "recurrence_id",
+            "instance_index",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     entry_id: int = Field(
         sa_column=Column(
             Integer,
             ForeignKey("calendarentry.id", ondelete="CASCADE"),
-            index=True,
         )
     )
     recurrence_id: int
     instance_index: int
-    completed_by: str
+    completed_by: str = Field(index=True)
     completed_at: datetime = Field(default_factory=get_now)
 
 
+# Built once so the keyed get/delete below skip per-call expression
+# construction; values are supplied through bind parameters at execution.
+_COMPLETION_KEY_WHERE = (
+    (ChoreCompletion.entry_id == bindparam("entry_id"))
+    & (ChoreCompletion.recurrence_id == bindparam("recurrence_id"))
+    & (ChoreCompletion.instance_index == bindparam("instance_index"))
+)
+_GET_COMPLETION_STMT = select(ChoreCompletion).where(_COMPLETION_KEY_WHERE).limit(1)
+_DELETE_COMPLETION_STMT = delete(ChoreCompletion).where(_COMPLETION_KEY_WHERE)
+
+
 class ChoreCompletionStore:
     def __init__(self, engine):
         self.engine = engine
@@ -398,12 +534,14 @@ class ChoreCompletionStore:
         self, entry_id: int, recurrence_id: int, instance_index: int
     ) -> Optional[ChoreCompletion]:
         with Session(self.engine) as session:
-            stmt = select(ChoreCompletion).where(
-                (ChoreCompletion.entry_id == entry_id)
-                & (ChoreCompletion.recurrence_id == recurrence_id)
-                & (ChoreCompletion.instance_index == instance_index)
-            )
-            comp = session.exec(stmt).first()
+            comp = session.exec(
+                _GET_COMPLETION_STMT,
+                params={
+                    "entry_id": entry_id,
+                    "recurrence_id": recurrence_id,
+                    "instance_index": instance_index,
+                },
+            ).first()
             if comp:
                 comp.completed_at = ensure_tz(comp.completed_at)
             return comp
@@ -429,15 +567,39 @@ class ChoreCompletionStore:
 
     def delete(self, entry_id: int, recurrence_id: int, instance_index: int) -> None:
         with Session(self.engine) as session:
-            stmt = select(ChoreCompletion).where(
-                (ChoreCompletion.entry_id == entry_id)
-                & (ChoreCompletion.recurrence_id == recurrence_id)
-                & (ChoreCompletion.instance_index == instance_index)
+            session.exec(
+                _DELETE_COMPLETION_STMT,
+                params={
+                    "entry_id": entry_id,
+                    "recurrence_id": recurrence_id,
+                    "instance_index": instance_index,
+                },
             )
-            comp = session.exec(stmt).first()
-            if comp:
-                session.delete(comp)
-                session.commit()
+            session.commit()
+
+    def has_any(self, entry_id: int) -> bool:
+        """Return whether any completion exists for ``entry_id``.
+
+        Cheaper than :meth:`list_for_entry` when only existence matters.
+        """
+        with Session(self.engine) as session:
+            stmt = (
+                select(ChoreCompletion.id)
+                .where(ChoreCompletion.entry_id == entry_id)
+                .limit(1)
+            )
+            return session.exec(stmt).first() is not None
+
+    def delete_for_recurrence(self, entry_id: int, recurrence_id: int) -> None:
+        """Delete all completions for one recurrence with a single statement."""
+        with Session(self.engine) as session:
+            session.exec(
+                delete(ChoreCompletion).where(
+                    (ChoreCompletion.entry_id == entry_id)
+                    & (ChoreCompletion.recurrence_id == recurrence_id)
+                )
+            )
+            session.commit()
 
     def list_for_entry(self, entry_id: int) -> List[ChoreCompletion]:
         with Session(self.engine) as session:
@@ -447,8 +609,23 @@ class ChoreCompletionStore:
                 comp.completed_at = ensure_tz(comp.completed_at)
             return comps
 
+    def list_for_entries(
+        self, entry_ids: Iterable[int]
+    ) -> dict[int, List[ChoreCompletion]]:
+        """Fetch completions for many entries in one query, keyed by entry id."""
+        ids = [eid for eid in entry_ids if eid is not None]
+        result: dict[int, List[ChoreCompletion]] = {}
+        if not ids:
+            return result
+        with Session(self.engine) as session:
+            stmt = select(ChoreCompletion).where(ChoreCompletion.entry_id.in_(ids))
+            for comp in session.exec(stmt).all():
+                comp.completed_at = ensure_tz(comp.completed_at)
+                result.setdefault(comp.entry_id, []).append(comp)
+        return result
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimePeriod:
     start: datetime
     end: datetime
@@ -456,33 +633,31 @@ class TimePeriod:
     instance_index: int
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
 def _add_months_skip(dt: datetime, months: int) -> datetime:
     """Add months to a datetime, skipping months where the day doesn't exist."""
-    result = dt
+    year, month, day = dt.year, dt.month, dt.day
     step = 1 if months >= 0 else -1
     for _ in range(abs(months)):
-        year = result.year
-        month = result.month + step
-        if month > 12:
-            month = 1
-            year += 1
-        elif month < 1:
-            month = 12
-            year -= 1
-        day = result.day
         while True:
-            try:
-                result = result.replace(year=year, month=month, day=day)
+            month += step
+            if month > 12:
+                month = 1
+                year += 1
+            elif month < 1:
+                month = 12
+                year -= 1
+            if day <= _days_in_month(year, month):
                 break
-            except ValueError:
-                month += step
-                if month > 12:
-                    month = 1
-                    year += 1
-                elif month < 1:
-                    month = 12
-                    year -= 1
-    return result
+    return dt.replace(year=year, month=month, day=day)
 
 
 def _next_monthly_day_of_week(dt: datetime) -> datetime:
@@ -499,34 +674,65 @@ def _next_monthly_day_of_week(dt: datetime) -> datetime:
         if day > days_in_month:
             continue
         return dt.replace(year=year, month=month, day=day)
+_ONE_WEEK = timedelta(weeks=1)
+
+# Per-type step functions so the hot loop resolves the recurrence type once
+# instead of re-branching on it for every instance. OneTime is absent: it has
+# no next occurrence.
+_ADVANCERS: dict[RecurrenceType, Callable[[datetime], datetime]] = {
+    RecurrenceType.Weekly: lambda start: start + _ONE_WEEK,
+    RecurrenceType.MonthlyDayOfMonth: lambda start: _add_months_skip(start, 1),
+    RecurrenceType.MonthlyDayOfWeek: _next_monthly_day_of_week,
+    RecurrenceType.AnnualDayOfMonth: lambda start: _add_months_skip(start, 12),
+}
+
+
 def _advance(start: datetime, rtype: RecurrenceType) -> Optional[datetime]:
     if rtype == RecurrenceType.OneTime:
         return None
-    if rtype == RecurrenceType.Weekly:
-        return start + timedelta(weeks=1)
-    if rtype == RecurrenceType.MonthlyDayOfMonth:
-        return _add_months_skip(start, 1)
-    if rtype == RecurrenceType.MonthlyDayOfWeek:
-        return _next_monthly_day_of_week(start)
-    if rtype == RecurrenceType.AnnualDayOfMonth:
-        return _add_months_skip(start, 12)
-    raise ValueError(f"Unsupported recurrence type: {rtype}")
+    advance = _ADVANCERS.get(rtype)
+    if advance is None:
+        raise ValueError(f"Unsupported recurrence type: {rtype}")
+    return advance(start)
 
 
 def _recurrence_generator(
-    entry: CalendarEntry, rec: Recurrence, include_skipped: bool
+    entry: CalendarEntry,
+    rec: Recurrence,
+    include_skipped: bool,
+    until: Optional[datetime] = None,
 ) -> Iterator[TimePeriod]:
     none_after = ensure_tz(entry.none_after)
+    if until is not None and (none_after is None or until < none_after):
+        none_after = until
     none_before = ensure_tz(entry.none_before)
-    start = ensure_tz(rec.first_start)
+    first_start = ensure_tz(rec.first_start)
+    # Weekly is the common case and its nth start is a closed form, so step
+    # it by multiplication instead of going through the _advance dispatch.
+    weekly = rec.type == RecurrenceType.Weekly
+    advance = None if weekly else _ADVANCERS.get(rec.type)
+    # The recurrence-level duration never changes mid-loop; build the
+    # timedelta once instead of once per yielded period.
+    default_duration = timedelta(seconds=rec.duration_seconds)
+    start = first_start
     instance = 0
-    specs = rec.instance_specifics
+    # Instances before none_before are never yielded (the filter is on the
+    # nominal start), so jump straight to the window instead of stepping
+    # through and discarding them one by one. Weekly admits a closed form;
+    # the month-based types fast-forward without the per-instance override
+    # lookups the main loop does.
+    if none_before is not None and start is not None and start < none_before:
+        if weekly:
+            instance = -((first_start - none_before) // _ONE_WEEK)
+            start = first_start + timedelta(weeks=instance)
+        elif advance:
+            while start is not None and start < none_before:
+                instance += 1
+                start = ensure_tz(advance(start))
     while start and (not none_after or start <= none_after):
-        spec = specs.get(instance)
+        spec = _get_spec(rec, instance)
         start_override = start
         if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
             start_override = spec.start or start
         if (
             (not none_before or start >= none_before)
@@ -535,7 +741,10 @@ def _recurrence_generator(
                 or not (spec and spec.skip)
             )
         ):
-            dur = duration_for(entry, rec.id, instance)
+            if spec and spec.duration_seconds is not None:
+                dur = timedelta(seconds=spec.duration_seconds)
+            else:
+                dur = default_duration
             yield TimePeriod(
                 start=start_override,
                 end=start_override + dur,
@@ -543,28 +752,57 @@ def _recurrence_generator(
                 instance_index=instance,
             )
         instance += 1
-        start = _advance(start, rec.type)
-        start = ensure_tz(start) if start else None
+        if weekly:
+            start = first_start + timedelta(weeks=instance)
+        elif advance:
+            start = ensure_tz(advance(start))
+        else:
+            start = None
 
 
 def enumerate_time_periods(
-    entry: CalendarEntry, include_skipped: bool = False
+    entry: CalendarEntry,
+    include_skipped: bool = False,
+    until: Optional[datetime] = None,
 ) -> Iterator[TimePeriod]:
-    heap: List[tuple[datetime, int, Iterator[TimePeriod], TimePeriod]] = []
+    """Yield the entry's time periods in start order.
+
+    ``until`` bounds the expansion: no period whose nominal start is after it
+    is generated, so callers that only need a window don't have to
+    consume-and-discard the rest of an unbounded recurrence. The bound is on
+    the nominal start, not a per-instance start override — callers whose
+    logic depends on override starts near the bound must either pad ``until``
+    by the maximum early-start they allow or iterate unbounded.
+    """
+    generators: List[tuple[int, Iterator[TimePeriod]]] = []
     for rec in entry.recurrences:
         if not isinstance(rec, Recurrence):
             rec = Recurrence.model_validate(rec)
-        gen = _recurrence_generator(entry, rec, include_skipped)
+        generators.append(
+            (rec.id, _recurrence_generator(entry, rec, include_skipped, until))
+        )
+
+    # The overwhelmingly common case is a single recurrence; no merge needed.
+    if len(generators) == 1:
+        yield from generators[0][1]
+        return
+
+    heap: List[tuple[datetime, int, Iterator[TimePeriod], TimePeriod]] = []
+    for rid, gen in generators:
         first = next(gen, None)
         if first:
-            heappush(heap, (first.start, rec.id, gen, first))
+            heap.append((first.start, rid, gen, first))
+    heapify(heap)
 
     while heap:
-        _, rid, gen, period = heappop(heap)
+        _, rid, gen, period = heap[0]
         yield period
         nxt = next(gen, None)
         if nxt:
-            heappush(heap, (nxt.start, rid, gen, nxt))
+            # Replace the root in one sift instead of a pop followed by a push.
+            heapreplace(heap, (nxt.start, rid, gen, nxt))
+        else:
+            heappop(heap)
 
 
 def has_single_instance(entry: CalendarEntry) -> bool:
@@ -584,45 +822,106 @@ def has_single_instance(entry: CalendarEntry) -> bool:
     return second is None
 
 
+def _instance_start(rec: Recurrence, instance_index: int) -> Optional[datetime]:
+    """Directly compute the unoverridden start of the nth occurrence of ``rec``."""
+    start = ensure_tz(rec.first_start)
+    n = instance_index
+    if n == 0:
+        return start
+    if rec.type == RecurrenceType.OneTime:
+        return None
+    if rec.type == RecurrenceType.Weekly:
+        return start + timedelta(weeks=n)
+    if rec.type == RecurrenceType.MonthlyDayOfMonth:
+        return _add_months_skip(start, n)
+    if rec.type == RecurrenceType.AnnualDayOfMonth:
+        return _add_months_skip(start, 12 * n)
+    if rec.type == RecurrenceType.MonthlyDayOfWeek:
+        for _ in range(n):
+            start = _next_monthly_day_of_week(start)
+        return start
+    raise ValueError(f"Unsupported recurrence type: {rec.type}")
+
+
 def find_time_period(
     entry: CalendarEntry,
     recurrence_id: int,
     instance_index: int,
     include_skipped: bool = False,
 ) -> Optional[TimePeriod]:
-    # Ensure instance specifics are detached models
-    for i, rec in enumerate(entry.recurrences):
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-            entry.recurrences[i] = rec
-        rec.instance_specifics = {
-            idx: InstanceSpecifics.model_validate(
-                spec.model_dump() if isinstance(spec, InstanceSpecifics) else spec
-            )
-            for idx, spec in rec.instance_specifics.items()
-        }
-    for period in enumerate_time_periods(entry, include_skipped=include_skipped):
-        if (
-            period.recurrence_id == recurrence_id
-            and period.instance_index == instance_index
-        ):
-            return period
+    """Locate one instance by computing its start rather than enumerating.
+
+    ``instance_index`` is the raw per-recurrence counter that
+    :func:`_recurrence_generator` yields, so the nth start follows directly
+    from the recurrence type; only the same none_before/none_after/skip
+    filters the generator applies are needed on top.
+    """
+    if instance_index < 0:
+        return None
+    rec = get_recurrence(entry, recurrence_id)
+    if rec is None:
+        return None
+    start = _instance_start(rec, instance_index)
+    if start is None:
+        return None
+    none_after = ensure_tz(entry.none_after)
+    if none_after and start > none_after:
+        return None
+    none_before = ensure_tz(entry.none_before)
+    if none_before and start < none_before:
+        return None
+    spec = _get_spec(rec, instance_index)
+    if spec and spec.skip and not include_skipped:
+        return None
+    start_override = spec.start if spec and spec.start else start
+    dur = duration_for(entry, recurrence_id, instance_index)
+    return TimePeriod(
+        start=start_override,
+        end=start_override + dur,
+        recurrence_id=recurrence_id,
+        instance_index=instance_index,
+    )
+
+
+def get_recurrence(
+    entry: CalendarEntry, recurrence_id: int
+) -> Optional[Recurrence]:
+    """Return ``entry``'s recurrence with ``recurrence_id``, or ``None``.
+
+    Raw recurrence data is coerced to :class:`Recurrence` and written back in
+    place, so repeated lookups on the same entry skip re-validation and the
+    caller does not need a second scan to store the coerced object.
+    """
+    for idx, rec in enumerate(entry.recurrences):
+        if rec.id == recurrence_id:
+            if not isinstance(rec, Recurrence):
+                rec = Recurrence.model_validate(rec)
+                entry.recurrences[idx] = rec
+            return rec
     return None
 
 
+def _get_spec(rec: Recurrence, instance_index: int) -> Optional[InstanceSpecifics]:
+    """Return the override for ``instance_index``, coercing and caching it.
+
+    Like :func:`get_recurrence`, the validated model is written back so each
+    raw dict is parsed at most once per loaded entry.
+    """
+    spec = rec.instance_specifics.get(instance_index)
+    if spec is not None and not isinstance(spec, InstanceSpecifics):
+        spec = InstanceSpecifics.model_validate(spec)
+        rec.instance_specifics[instance_index] = spec
+    return spec
+
+
 def responsible_for(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> List[str]:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
-        if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
-            if spec.responsible:
-                return spec.responsible
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.responsible:
+            return spec.responsible
         if rec.responsible:
             return rec.responsible
     return entry.responsible
@@ -631,85 +930,61 @@ def responsible_for(
 def find_delegation(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> Optional[Delegation]:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
-        if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
-            if spec.responsible:
-                return Delegation(
-                    instance_index=instance_index, responsible=spec.responsible
-                )
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.responsible:
+            return Delegation(
+                instance_index=instance_index, responsible=spec.responsible
+            )
     return None
 
 
 def find_instance_note(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> Optional[InstanceNote]:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
-        if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
-            if spec.note is not None:
-                return InstanceNote(instance_index=instance_index, note=spec.note)
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.note is not None:
+            return InstanceNote(instance_index=instance_index, note=spec.note)
     return None
 
 
 def find_instance_duration(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> Optional[InstanceDuration]:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
-        if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
-            if spec.duration_seconds is not None:
-                return InstanceDuration(
-                    instance_index=instance_index,
-                    duration_seconds=spec.duration_seconds,
-                )
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.duration_seconds is not None:
+            return InstanceDuration(
+                instance_index=instance_index,
+                duration_seconds=spec.duration_seconds,
+            )
     return None
 
 
 def find_instance_start(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> Optional[InstanceStart]:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
-        if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
-            if spec.start is not None:
-                return InstanceStart(
-                    instance_index=instance_index, start=ensure_tz(spec.start)
-                )
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.start is not None:
+            return InstanceStart(
+                instance_index=instance_index, start=ensure_tz(spec.start)
+            )
     return None
 
 
 def is_instance_skipped(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> bool:
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
-        spec = rec.instance_specifics.get(instance_index)
+        spec = _get_spec(rec, instance_index)
         if spec:
-            if not isinstance(spec, InstanceSpecifics):
-                spec = InstanceSpecifics.model_validate(spec)
             return bool(spec.skip)
     return False
 
@@ -717,13 +992,11 @@ def is_instance_skipped(
 def duration_for(
     entry: CalendarEntry, recurrence_id: int, instance_index: int
 ) -> timedelta:
-    override = find_instance_duration(entry, recurrence_id, instance_index)
-    if override:
-        return timedelta(seconds=override.duration_seconds)
-    rec = next((r for r in entry.recurrences if r.id == recurrence_id), None)
+    rec = get_recurrence(entry, recurrence_id)
     if rec:
-        if not isinstance(rec, Recurrence):
-            rec = Recurrence.model_validate(rec)
+        spec = _get_spec(rec, instance_index)
+        if spec and spec.duration_seconds is not None:
+            return timedelta(seconds=spec.duration_seconds)
         return timedelta(seconds=rec.duration_seconds)
     return timedelta(0)
 
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, tzinfo, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
+@lru_cache(maxsize=8)
+def _named_tz(tz_name: str) -> tzinfo:
+    return ZoneInfo(tz_name)
+
+
 def _configured_tz() -> tzinfo:
-    """Return the timezone configured for the application."""
+    """Return the timezone configured for the application.
+
+    The named-zone lookup is memoized because ensure_tz calls this for every
+    datetime it touches. The system-timezone fallback is deliberately not
+    cached: ``astimezone()`` yields a fixed-offset zone that must track DST
+    transitions between calls.
+    """
     tz_name = os.getenv("CHORETRACKER_TZ")
     if tz_name:
-        return ZoneInfo(tz_name)
+        return _named_tz(tz_name)
     system_tz = datetime.now().astimezone().tzinfo
     return system_tz if system_tz is not None else ZoneInfo("UTC")
 
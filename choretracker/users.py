@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import BinaryIO, List, Optional, Set
 import io
 import types
 import re
@@ -57,10 +57,11 @@ def hash_secret(secret: str) -> str:
     return pwd_context.hash(secret)
 
 
-def process_profile_picture(data: bytes) -> bytes:
-    """Process uploaded profile picture according to requirements."""
+def process_profile_picture(data: bytes | BinaryIO) -> bytes:
+    """Process an uploaded profile picture (raw bytes or a readable file)."""
 
-    with Image.open(io.BytesIO(data)) as img:
+    source = io.BytesIO(data) if isinstance(data, bytes) else data
+    with Image.open(source) as img:
         img = img.convert("RGBA")
         width, height = img.size
         size = min(width, height)
@@ -82,6 +83,25 @@ class UserStore:
 
     def __init__(self, engine):
         self.engine = engine
+        # Lazily computed count of users with the ``admin`` permission,
+        # invalidated whenever a user record is written.
+        self._admin_count: Optional[int] = None
+
+    def invalidate_admin_count(self) -> None:
+        """Drop the cached admin count so it is recomputed on next use."""
+
+        self._admin_count = None
+
+    def admin_count(self) -> int:
+        """Return the number of users holding the ``admin`` permission."""
+
+        if self._admin_count is None:
+            self._admin_count = sum(
+                1
+                for u in self.list_users(include_viewer=True)
+                if "admin" in u.permissions
+            )
+        return self._admin_count
 
     def list_users(self, include_viewer: bool = False) -> List[User]:
         with Session(self.engine) as session:
@@ -122,6 +142,7 @@ class UserStore:
             )
             session.add(user)
             session.commit()
+            self.invalidate_admin_count()
             return True
 
     def update(
@@ -213,6 +234,7 @@ class UserStore:
                     session.add(comp)
 
             session.commit()
+            self.invalidate_admin_count()
             return True
 
     def delete(self, username: str) -> None:
@@ -223,6 +245,7 @@ class UserStore:
             if user:
                 session.delete(user)
                 session.commit()
+                self.invalidate_admin_count()
 
     def has_permission(self, username: str, permission: str) -> bool:
         user = self.get(username)
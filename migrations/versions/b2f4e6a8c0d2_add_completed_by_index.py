@@ -0,0 +1,27 @@
+"""add completed_by index
+
+Revision ID: b2f4e6a8c0d2
+Revises: d4a3b2c1e5f6
+Create Date: 2025-09-01 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'b2f4e6a8c0d2'
+down_revision: Union[str, Sequence[str], None] = 'd4a3b2c1e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f('ix_chorecompletion_completed_by'),
+        'chorecompletion',
+        ['completed_by'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_chorecompletion_completed_by'), table_name='chorecompletion')
@@ -0,0 +1,23 @@
+"""add entry updated_at
+
+Revision ID: c8e1a3b5d7f9
+Revises: b2f4e6a8c0d2
+Create Date: 2025-09-01 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'c8e1a3b5d7f9'
+down_revision: Union[str, Sequence[str], None] = 'b2f4e6a8c0d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('calendarentry', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('calendarentry', 'updated_at')
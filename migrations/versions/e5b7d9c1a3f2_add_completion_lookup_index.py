@@ -0,0 +1,33 @@
+"""add completion lookup index
+
+Revision ID: e5b7d9c1a3f2
+Revises: c8e1a3b5d7f9
+Create Date: 2025-09-01 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'e5b7d9c1a3f2'
+down_revision: Union[str, Sequence[str], None] = 'c8e1a3b5d7f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_chorecompletion_entry_recurrence_instance',
+        'chorecompletion',
+        ['entry_id', 'recurrence_id', 'instance_index'],
+    )
+    op.drop_index(op.f('ix_chorecompletion_entry_id'), table_name='chorecompletion')
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f('ix_chorecompletion_entry_id'), 'chorecompletion', ['entry_id']
+    )
+    op.drop_index(
+        'ix_chorecompletion_entry_recurrence_instance', table_name='chorecompletion'
+    )
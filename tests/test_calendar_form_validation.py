@@ -0,0 +1,66 @@
+import importlib
+import sys
+from pathlib import Path
+from datetime import timedelta
+
+from choretracker.time_utils import get_now
+from fastapi.testclient import TestClient
+
+# Ensure project root on path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+
+def _client(tmp_path, monkeypatch):
+    db_file = tmp_path / "test.db"
+    monkeypatch.setenv("CHORETRACKER_DB", str(db_file))
+    if "choretracker.app" in sys.modules:
+        del sys.modules["choretracker.app"]
+    app_module = importlib.import_module("choretracker.app")
+    client = TestClient(app_module.app)
+    client.post("/login", data={"username": "Admin", "password": "admin"}, follow_redirects=False)
+    return app_module, client
+
+
+def test_non_numeric_duration_rejected(tmp_path, monkeypatch):
+    app_module, client = _client(tmp_path, monkeypatch)
+
+    future = (get_now() + timedelta(days=1)).isoformat(timespec="minutes")
+    resp = client.post(
+        "/calendar/new",
+        data={
+            "title": "Task",
+            "type": "Event",
+            "recurrence_type[]": "OneTime",
+            "recurrence_first_start[]": future,
+            "recurrence_duration_hours[]": "one",
+            "managers": "Admin",
+        },
+        follow_redirects=False,
+    )
+    assert resp.status_code == 400
+    assert "Invalid duration" in resp.text
+    assert app_module.calendar_store.list_entries() == []
+
+
+def test_mismatched_recurrence_rows_rejected(tmp_path, monkeypatch):
+    app_module, client = _client(tmp_path, monkeypatch)
+
+    future = (get_now() + timedelta(days=1)).isoformat(timespec="minutes")
+    later = (get_now() + timedelta(days=2)).isoformat(timespec="minutes")
+    # Two start rows but only one type row: the trailing data row has no
+    # recurrence type and must be rejected, not silently dropped.
+    resp = client.post(
+        "/calendar/new",
+        data={
+            "title": "Task",
+            "type": "Event",
+            "recurrence_type[]": "OneTime",
+            "recurrence_first_start[]": [future, later],
+            "recurrence_duration_hours[]": ["1", "1"],
+            "managers": "Admin",
+        },
+        follow_redirects=False,
+    )
+    assert resp.status_code == 400
+    assert "Mismatched recurrence fields" in resp.text
+    assert app_module.calendar_store.list_entries() == []
@@ -0,0 +1,55 @@
+import importlib
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# Ensure project root on path
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from choretracker.calendar import (
+    CalendarEntry,
+    CalendarEntryType,
+    InstanceSpecifics,
+    Recurrence,
+    RecurrenceType,
+)
+
+
+def test_early_started_instance_counts_as_finished(tmp_path, monkeypatch):
+    db_file = tmp_path / "test.db"
+    monkeypatch.setenv("CHORETRACKER_DB", str(db_file))
+    if "choretracker.app" in sys.modules:
+        del sys.modules["choretracker.app"]
+    app_module = importlib.import_module("choretracker.app")
+
+    now = datetime(2000, 1, 22, 12, 0, 0, tzinfo=ZoneInfo("UTC"))
+
+    rec = Recurrence(
+        id=0,
+        type=RecurrenceType.Weekly,
+        first_start=datetime(2000, 1, 23, 12, 0, 0, tzinfo=ZoneInfo("UTC")),
+        duration_seconds=3600,
+    )
+    # Instance 0 was started early via a start override and has already
+    # finished, even though its nominal start is still in the future.
+    rec.instance_specifics[0] = InstanceSpecifics(
+        entry_id=0,
+        recurrence_id=0,
+        instance_index=0,
+        start=now - timedelta(hours=2),
+    )
+    entry = CalendarEntry(
+        title="Task",
+        description="",
+        type=CalendarEntryType.Event,
+        recurrences=[rec],
+        responsible=["Admin"],
+        managers=["Admin"],
+    )
+    assert app_module.has_finished_instances(entry, now=now)
+
+    # Control: without the override the first nominal start is tomorrow, so
+    # nothing has finished yet.
+    rec.instance_specifics.pop(0)
+    assert not app_module.has_finished_instances(entry, now=now)